@@ -15,6 +15,7 @@ Classes:
     Item: Represents an inventory item.
 
 Functions:
+    load_creds: Reads the local credential file on first use.
     get_client: Instantiates a HomeboxClient from local credential files.
     load_locations_from_csv: Loads locations from a CSV file.
     cli: Command-line interface handler.
@@ -26,32 +27,52 @@ TagId = str
 PathStr = str
 CsvFilePath = str
 
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import argparse
 import csv
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Callable, Any
+from typing import Optional, List, Dict, Callable, Any, Iterator
 import json
+import os
+import functools
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-with open("creds.json", "r", encoding="utf8") as ifile:
-    CREDS = json.loads(ifile.read())
-    BASE_URL = CREDS["base_url"] + "/api/v1"
-    USERNAME = CREDS["username"]
-    PASSWORD = CREDS["password"]
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+CREDS_FILE = "creds.json"
+
+
+@functools.lru_cache(maxsize=None)
+def load_creds() -> Dict[str, str]:
+    """Reads creds.json on first use rather than at import time."""
+    return json.loads(Path(CREDS_FILE).read_text(encoding="utf8"))
 
 
 def get_client() -> Any:
     """get_client method."""
-    return HomeboxClient(BASE_URL, USERNAME, PASSWORD)
+    creds = load_creds()
+    return HomeboxClient(
+        creds["base_url"] + "/api/v1", creds["username"], creds["password"]
+    )
 
 
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__.
+DATACLASS_OPTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTS)
 class Location:
     """Location class."""
 
@@ -66,65 +87,59 @@ class Location:
         """parent method."""
         if self.parentId is None:
             return None
-        return next(
-            (l for l in self.client.get_all_locations() if l.id == self.parentId), None
-        )
+        if self.client._locations_cache is None:
+            self.client.get_all_locations()
+        return self.client._locs_by_id.get(self.parentId)
 
     def delete(self) -> Any:
         """delete method."""
-        res = requests.delete(
-            f"{self.client.base_url}/locations/{self.id}", headers=self.client.headers
-        )
+        res = self.client.session.delete(f"{self.client.base_url}/locations/{self.id}")
         res.raise_for_status()
+        self.client._invalidate_locations()
         logging.info(f"Deleted location '{self.name}'")
 
-    def rename(self, new_name: str) -> Any:
-        """rename method."""
+    def update(
+        self,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        parent_name: Optional[str] = None,
+    ) -> Any:
+        """
+        Applies any combination of name, description and parent changes in a
+        single PUT.
+        """
         data = {
-            "name": new_name,
-            "description": self.description,
+            "name": self.name if name is None else name,
+            "description": self.description if description is None else description,
             "parentId": self.parentId,
         }
-        res = requests.put(
+        if parent_name is not None:
+            parent = self.client.get_location(parent_name)
+            if not parent:
+                raise ValueError(f"Parent location '{parent_name}' not found.")
+            data["parentId"] = parent.id
+        res = self.client.session.put(
             f"{self.client.base_url}/locations/{self.id}",
-            headers=self.client.headers,
             json=data,
         )
         res.raise_for_status()
-        self.name = new_name
+        self.client._invalidate_locations()
+        self.name = data["name"]
+        self.description = data["description"]
+        self.parentId = data["parentId"]
+
+    def rename(self, new_name: str) -> Any:
+        """rename method."""
+        self.update(name=new_name)
 
     def set_description(self, new_description: str) -> Any:
         """set_description method."""
-        data = {
-            "name": self.name,
-            "description": new_description,
-            "parentId": self.parentId,
-        }
-        res = requests.put(
-            f"{self.client.base_url}/locations/{self.id}",
-            headers=self.client.headers,
-            json=data,
-        )
-        res.raise_for_status()
-        self.description = new_description
+        self.update(description=new_description)
 
     def set_parent(self, new_parent_name: str) -> Any:
         """set_parent method."""
-        parent = self.client.get_location(new_parent_name)
-        if not parent:
-            raise ValueError(f"Parent location '{new_parent_name}' not found.")
-        data = {
-            "name": self.name,
-            "description": self.description,
-            "parentId": parent["id"],
-        }
-        res = requests.put(
-            f"{self.client.base_url}/locations/{self.id}",
-            headers=self.client.headers,
-            json=data,
-        )
-        res.raise_for_status()
-        self.parentId = parent["id"]
+        self.update(parent_name=new_parent_name)
 
     def to_dict(self) -> Any:
         """to_dict method."""
@@ -136,67 +151,63 @@ class Location:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTS)
 class Tag:
     """Tag class."""
 
-
-@dataclass
-class Label:
-    """Label class."""
-
     id: str
     name: str
     client: "HomeboxClient" = field(repr=False)
 
     def delete(self) -> Any:
         """delete method."""
-        res = requests.delete(
-            f"{self.client.base_url}/labels/{self.id}", headers=self.client.headers
-        )
+        res = self.client.session.delete(f"{self.client.base_url}/tags/{self.id}")
         res.raise_for_status()
+        self.client._invalidate_tags()
 
     def rename(self, new_name: str) -> Any:
         """rename method."""
-        res = requests.put(
-            f"{self.client.base_url}/labels/{self.id}",
-            headers=self.client.headers,
+        res = self.client.session.put(
+            f"{self.client.base_url}/tags/{self.id}",
             json={"name": new_name},
         )
         res.raise_for_status()
+        self.client._invalidate_tags()
         self.name = new_name
 
-    def to_dict(self) -> Dict[str, str]:
+    def to_dict(self) -> Any:
         """to_dict method."""
         return {"id": self.id, "name": self.name}
 
+
+@dataclass(**DATACLASS_OPTS)
+class Label:
+    """Label class."""
+
     id: str
     name: str
     client: "HomeboxClient" = field(repr=False)
 
     def delete(self) -> Any:
         """delete method."""
-        res = requests.delete(
-            f"{self.client.base_url}/tags/{self.id}", headers=self.client.headers
-        )
+        res = self.client.session.delete(f"{self.client.base_url}/labels/{self.id}")
         res.raise_for_status()
 
     def rename(self, new_name: str) -> Any:
         """rename method."""
-        res = requests.put(
-            f"{self.client.base_url}/tags/{self.id}",
-            headers=self.client.headers,
+        res = self.client.session.put(
+            f"{self.client.base_url}/labels/{self.id}",
             json={"name": new_name},
         )
         res.raise_for_status()
         self.name = new_name
 
-    def to_dict(self) -> Any:
+    def to_dict(self) -> Dict[str, str]:
         """to_dict method."""
         return {"id": self.id, "name": self.name}
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTS)
 class Item:
     """Item class."""
 
@@ -210,9 +221,7 @@ class Item:
 
     def delete(self) -> Any:
         """delete method."""
-        res = requests.delete(
-            f"{self.client.base_url}/items/{self.id}", headers=self.client.headers
-        )
+        res = self.client.session.delete(f"{self.client.base_url}/items/{self.id}")
         res.raise_for_status()
 
     def to_dict(self) -> Any:
@@ -234,67 +243,155 @@ class HomeboxClient:
         """__init__ method."""
         self.base_url = base_url.rstrip("/")
         self.headers = {"Content-Type": "application/json"}
+        self.session = requests.Session()
+        retry = Retry(
+            total=5,
+            backoff_factor=0.25,
+            status_forcelist=(502, 503, 504),
+            # POST is left out: after a 502/504 the create may already have
+            # happened, and a retry would duplicate it.
+            allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+        self._locations_cache: Optional[List[Location]] = None
+        self._locs_by_id: Dict[LocationId, Location] = {}
+        self._locs_by_name: Dict[str, List[Location]] = {}
+        self._locs_lower: Dict[LocationId, str] = {}
+        self._path_cache: Dict[PathStr, Optional[LocationId]] = {}
+        self._location_paths: Optional[Dict[LocationId, PathStr]] = None
+        self._tags_cache: Optional[List[Tag]] = None
+        self._tag_lookup: Optional[Dict[TagId, str]] = None
+        self._tag_by_name: Dict[str, Tag] = {}
         self._authenticate(username, password)
+        self.session.headers.update(self.headers)
 
     def _authenticate(self, username: Any, password: Any) -> Any:
         """_authenticate method."""
-        res = requests.post(
+        res = self.session.post(
             f"{self.base_url}/users/login",
             json={"username": username, "password": password},
-            headers=self.headers,
         )
         res.raise_for_status()
-        self.headers["Authorization"] = res.json()["token"]
-        print(res.json()["token"])
+        body = json_loads(res.content)
+        self.headers["Authorization"] = body["token"]
+
+    def _invalidate_locations(self) -> None:
+        """Drops the cached location list so the next lookup refetches it."""
+        self._locations_cache = None
+        self._locs_by_id = {}
+        self._locs_by_name = {}
+        self._locs_lower = {}
+        self._path_cache = {}
+        self._location_paths = None
+
+    def _cache_location(self, loc: Location) -> None:
+        """Adds a newly created location to the warm location caches."""
+        if self._locations_cache is None:
+            return
+        self._locations_cache.append(loc)
+        self._locs_by_id[loc.id] = loc
+        self._locs_by_name.setdefault(loc.name, []).append(loc)
+        self._locs_lower[loc.id] = loc.name.casefold()
+        if self._location_paths is not None:
+            parent_path = (
+                self._location_paths.get(loc.parentId) if loc.parentId else None
+            )
+            self._location_paths[loc.id] = (
+                parent_path + "/" + loc.name if parent_path else loc.name
+            )
+
+    def _invalidate_tags(self) -> None:
+        """Drops the cached tag list and lookups so the next lookup refetches them."""
+        self._tags_cache = None
+        self._tag_lookup = None
+        self._tag_by_name = {}
 
-    def get_all_locations(self) -> List[Location]:
+    def _fetch_location_parents(
+        self, loc_ids: List[LocationId]
+    ) -> Dict[LocationId, Optional[LocationId]]:
         """
-        Fetches all locations and enriches them with parentId by querying each /locations/{id}.
+        Maps each location id to its parent id.
+        Uses the single /locations/tree call when the server supports it, and falls
+        back to fetching /locations/{id} for every id concurrently otherwise.
         """
-        res = requests.get(f"{self.base_url}/locations", headers=self.headers)
-        res.raise_for_status()
-        base_locs = res.json()
-        locations = []
-        for loc in base_locs:
-            loc_id = loc["id"]
-            detail_res = requests.get(
-                f"{self.base_url}/locations/{loc_id}", headers=self.headers
-            )
+        res = self.session.get(
+            f"{self.base_url}/locations/tree", params={"withItems": "false"}
+        )
+        if res.ok:
+            parents: Dict[LocationId, Optional[LocationId]] = {}
+            stack = [(node, None) for node in json_loads(res.content)]
+            while stack:
+                node, parent_id = stack.pop()
+                parents[node["id"]] = parent_id
+                stack.extend(
+                    (child, node["id"]) for child in node.get("children") or []
+                )
+            if all(loc_id in parents for loc_id in loc_ids):
+                return parents
+        logging.debug("Location tree unavailable, fetching location details")
+
+        def fetch_parent(loc_id: LocationId) -> Any:
+            """Returns (loc_id, parent_id) from the location detail endpoint."""
+            detail_res = self.session.get(f"{self.base_url}/locations/{loc_id}")
             detail_res.raise_for_status()
-            detailed = detail_res.json()
-            parent_obj = detailed.get("parent")
-            parent_id = parent_obj["id"] if parent_obj else None
-            location = Location(
-                id=loc_id,
-                name=detailed["name"],
-                description=detailed.get("description", ""),
-                parentId=parent_id,
+            parent_obj = json_loads(detail_res.content).get("parent")
+            return loc_id, parent_obj["id"] if parent_obj else None
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            futures = [pool.submit(fetch_parent, loc_id) for loc_id in loc_ids]
+            return dict(future.result() for future in as_completed(futures))
+
+    def get_all_locations(self, force: bool = False) -> List[Location]:
+        """
+        Fetches all locations and enriches them with parentId from the location tree.
+        The result is cached on the client until a mutating call invalidates it;
+        pass force=True to bypass the cache after an external change.
+        """
+        if self._locations_cache is not None and not force:
+            return list(self._locations_cache)
+        res = self.session.get(f"{self.base_url}/locations")
+        res.raise_for_status()
+        base_locs = json_loads(res.content)
+        parents = self._fetch_location_parents([loc["id"] for loc in base_locs])
+        locations = [
+            Location(
+                id=loc["id"],
+                name=loc["name"],
+                description=loc.get("description", ""),
+                parentId=parents.get(loc["id"]),
                 client=self,
             )
-            locations.append(location)
-        return locations
+            for loc in base_locs
+        ]
+        self._locations_cache = locations
+        self._locs_by_id = {loc.id: loc for loc in locations}
+        self._locs_by_name = {}
+        for loc in locations:
+            self._locs_by_name.setdefault(loc.name, []).append(loc)
+        self._locs_lower = {loc.id: loc.name.casefold() for loc in locations}
+        self._path_cache = {}
+        self._location_paths = None
+        return list(locations)
 
     def get_location(
         self, name: str, parent_name: Optional[str] = None
-    ) -> Optional[dict]:
+    ) -> Optional[Location]:
         """
         Retrieves a location by name, optionally filtering by parent name.
-        Uses /locations for fast match, then /locations/{id} for parent check.
-        Returns full location dict with 'parentId' field populated.
+        Served from the cached name/id lookups built by get_all_locations.
         """
-        res = requests.get(f"{self.base_url}/locations", headers=self.headers)
-        res.raise_for_status()
-        all_locs = res.json()
-        candidates = [l for l in all_locs if l["name"] == name]
-        for loc in candidates:
-            loc_id = loc["id"]
-            detail = requests.get(
-                f"{self.base_url}/locations/{loc_id}", headers=self.headers
-            ).json()
-            parent = detail.get("parent", {}).get("name")
-            if parent_name is None or parent == parent_name:
-                detail["parentId"] = detail.get("parent", {}).get("id")
-                return detail
+        if self._locations_cache is None:
+            self.get_all_locations()
+        for loc in self._locs_by_name.get(name, []):
+            if parent_name is None:
+                return loc
+            parent = self._locs_by_id.get(loc.parentId) if loc.parentId else None
+            if parent is not None and parent.name == parent_name:
+                return loc
         return None
 
     def create_location(
@@ -306,18 +403,39 @@ class HomeboxClient:
                 f"Location '{name}' (parent: '{parent_name}') already exists. Skipping."
             )
             return None
-        parent_id = self.get_location(parent_name)["id"] if parent_name else None
+        return self._post_location(name, description, parent_name)
+
+    def _post_location(
+        self, name: str, description: str = "", parent_name: Optional[str] = None
+    ) -> dict:
+        """Creates a location without an existence check and caches it."""
+        parent_id = None
+        if parent_name:
+            parent = self.get_location(parent_name)
+            if not parent:
+                raise ValueError(f"Parent location '{parent_name}' not found.")
+            parent_id = parent.id
         data = {"name": name, "description": description, "parentId": parent_id}
-        res = requests.post(
-            f"{self.base_url}/locations", headers=self.headers, json=data
-        )
+        res = self.session.post(f"{self.base_url}/locations", json=data)
         res.raise_for_status()
-        return res.json()
+        created = json_loads(res.content)
+        self._cache_location(
+            Location(
+                id=created["id"],
+                name=created["name"],
+                description=created.get("description", ""),
+                parentId=parent_id,
+                client=self,
+            )
+        )
+        return created
 
     def resolve_location_path(self, path: PathStr) -> Optional[str]:
         """resolve_location_path method."""
         if not path:
             return None
+        if path in self._path_cache:
+            return self._path_cache[path]
         parts = path.strip().split("/")
         current_parent = None
         for part in parts:
@@ -325,52 +443,104 @@ class HomeboxClient:
             if not loc:
                 raise ValueError(f"Location path '{path}' is invalid at '{part}'")
             current_parent = part
-        return loc["id"]
+        self._path_cache[path] = loc.id
+        return loc.id
 
-    def get_tags(self) -> List[Tag]:
-        """get_tags method."""
-        res = requests.get(f"{self.base_url}/tags", headers=self.headers)
+    def get_tags(self, force: bool = False) -> List[Tag]:
+        """
+        Fetches all tags, caching them on the client until a tag is created,
+        renamed or deleted; pass force=True to bypass the cache.
+        """
+        if self._tags_cache is not None and not force:
+            return list(self._tags_cache)
+        res = self.session.get(f"{self.base_url}/tags")
+        res.raise_for_status()
+        tags = [
+            Tag(id=t["id"], name=t["name"], client=self)
+            for t in json_loads(res.content)
+        ]
+        self._tags_cache = tags
+        self._tag_lookup = {tag.id: tag.name for tag in tags}
+        self._tag_by_name = {}
+        for tag in tags:
+            self._tag_by_name.setdefault(tag.name, tag)
+        return list(tags)
+
+    def get_tag_by_name(self, name: str) -> Optional[Tag]:
+        """Looks a tag up by name in the cached tag list."""
+        if self._tags_cache is None:
+            self.get_tags()
+        return self._tag_by_name.get(name)
+
+    def _create_tag(self, name: str) -> Tag:
+        """Creates a tag and adds it to the cached tag lookups."""
+        res = self.session.post(f"{self.base_url}/tags", json={"name": name})
         res.raise_for_status()
-        return [Tag(id=t["id"], name=t["name"], client=self) for t in res.json()]
+        t = json_loads(res.content)
+        tag = Tag(id=t["id"], name=t["name"], client=self)
+        if self._tags_cache is not None:
+            self._tags_cache.append(tag)
+            self._tag_lookup[tag.id] = tag.name
+            self._tag_by_name.setdefault(tag.name, tag)
+        return tag
 
     def get_or_create_tag(self, name: str) -> Tag:
         """get_or_create_tag method."""
-        for tag in self.get_tags():
-            if tag.name == name:
-                return tag
-        res = requests.post(
-            f"{self.base_url}/tags", headers=self.headers, json={"name": name}
-        )
-        res.raise_for_status()
-        t = res.json()
-        return Tag(id=t["id"], name=t["name"], client=self)
+        return self.get_tag_by_name(name) or self._create_tag(name)
 
     def resolve_tag_names(self, tag_names_str: TagId) -> List[str]:
         """resolve_tag_names method."""
         if not tag_names_str:
             return []
         tag_names = [t.strip() for t in tag_names_str.split(",")]
-        return [self.get_or_create_tag(name).id for name in tag_names]
+        get_tag = self.get_tag_by_name
+        return [(get_tag(name) or self._create_tag(name)).id for name in tag_names]
 
-    def get_items(self) -> List[Item]:
-        """get_items method."""
-        res = requests.get(f"{self.base_url}/items", headers=self.headers)
-        res.raise_for_status()
-        return [
-            Item(
-                id=i["id"],
-                name=i["name"],
-                description=i.get("description", ""),
-                quantity=i.get("quantity", 1),
-                locationId=i.get("locationId"),
-                tagIds=i.get("tagIds", []),
-                client=self,
+    def get_items(self, page_size: int = 500) -> Iterator[Item]:
+        """
+        Yields all items, requesting /items one page at a time until the page
+        object's total is reached. Servers that return a plain list instead of a
+        page object are read in one go.
+        """
+        page = 1
+        seen = 0
+        last_first_id = None
+        while True:
+            res = self.session.get(
+                f"{self.base_url}/items", params={"page": page, "pageSize": page_size}
             )
-            for i in res.json()
-        ]
+            res.raise_for_status()
+            body = json_loads(res.content)
+            batch = body if isinstance(body, list) else body.get("items") or []
+            if not batch or batch[0]["id"] == last_first_id:
+                # An empty page, or the same page again from a server that
+                # ignores the page parameter.
+                return
+            last_first_id = batch[0]["id"]
+            seen += len(batch)
+            for i in batch:
+                yield Item(
+                    id=i["id"],
+                    name=i["name"],
+                    description=i.get("description", ""),
+                    quantity=i.get("quantity", 1),
+                    locationId=i.get("locationId"),
+                    tagIds=i.get("tagIds", []),
+                    client=self,
+                )
+            if isinstance(body, list):
+                return
+            total = body.get("total")
+            if total is not None and seen >= total:
+                return
+            if total is None and len(batch) < page_size:
+                return
+            page += 1
 
     def build_location_lookup_tree(self) -> Dict[str, str]:
         """build_location_lookup_tree method."""
+        if self._location_paths is not None:
+            return dict(self._location_paths)
         all_locations = self.get_all_locations()
         by_id = {loc.id: loc for loc in all_locations}
         full_paths = {}
@@ -378,136 +548,175 @@ class HomeboxClient:
         def get_path(loc: Any) -> Any:
             """
             get_path method.
+            Walks up to the nearest ancestor with a known path, then fills in the
+            paths of every location on the way back down.
             :param loc:
             :type loc: Any
             :return:
             :rtype: Any
             """
-            if loc.id in full_paths:
-                return full_paths[loc.id]
-            if not loc.parentId:
-                full_paths[loc.id] = loc.name
-            else:
-                parent = by_id.get(loc.parentId)
-                full_paths[loc.id] = (
-                    get_path(parent) + "/" + loc.name if parent else loc.name
-                )
+            chain = []
+            seen = set()
+            cur = loc
+            while cur is not None and cur.id not in full_paths and cur.id not in seen:
+                chain.append(cur)
+                seen.add(cur.id)
+                cur = by_id.get(cur.parentId) if cur.parentId else None
+            base = full_paths.get(cur.id, "") if cur is not None else ""
+            for node in reversed(chain):
+                base = base + "/" + node.name if base else node.name
+                full_paths[node.id] = base
             return full_paths[loc.id]
 
         for loc in all_locations:
             get_path(loc)
-        return full_paths
+        self._location_paths = full_paths
+        return dict(full_paths)
 
     def build_tag_lookup(self) -> Dict[str, str]:
         """build_tag_lookup method."""
-        return {tag.id: tag.name for tag in self.get_tags()}
+        if self._tag_lookup is None:
+            self.get_tags()
+        return dict(self._tag_lookup)
 
     def search_location(
         self, substring: str, ignore_case: bool = True
     ) -> List[Location]:
         """search_location method."""
         all_locations = self.get_all_locations()
-        matches = []
-
-        def match(a: str, b: str) -> bool:
-            """
-            match method.
-            :param a:
-            :type a: Any
-            :param b:
-            :type b: Any
-            :return:
-            :rtype: Any
-            """
-            return b.lower() in a.lower() if ignore_case else b in a
-
-        for loc in all_locations:
-            if match(loc.name, substring):
-                matches.append(loc)
-        return matches
+        if not ignore_case:
+            return [loc for loc in all_locations if substring in loc.name]
+        needle = substring.casefold()
+        by_id = self._locs_by_id
+        return [by_id[i] for i, name in self._locs_lower.items() if needle in name]
 
     def export_items_readable_csv(self, filepath: PathStr) -> None:
         """export_items_readable_csv method."""
         items = self.get_items()
         loc_map = self.build_location_lookup_tree()
         tag_map = self.build_tag_lookup()
-        with open(filepath, mode="w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "id",
-                    "name",
-                    "description",
-                    "quantity",
-                    "locationPath",
-                    "tags",
-                ],
-            )
-            writer.writeheader()
-            for item in items:
-                writer.writerow(
-                    {
-                        "id": item.id,
-                        "name": item.name,
-                        "description": item.description,
-                        "quantity": item.quantity,
-                        "locationPath": loc_map.get(item.locationId, ""),
-                        "tags": ", ".join(
-                            (tag_map.get(tid, "") for tid in item.tagIds)
-                        ),
-                    }
+        loc_map_get = loc_map.get
+        tag_map_get = tag_map.get
+        tag_join = ", ".join
+        # Items are fetched while writing, so write to a temporary file and only
+        # replace the existing export once every page has been read.
+        tmp_path = f"{filepath}.tmp"
+        try:
+            with open(tmp_path, mode="w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writerow = writer.writerow
+                writerow(
+                    ("id", "name", "description", "quantity", "locationPath", "tags")
                 )
+                for item in items:
+                    writerow(
+                        (
+                            item.id,
+                            item.name,
+                            item.description,
+                            item.quantity,
+                            loc_map_get(item.locationId, ""),
+                            tag_join([tag_map_get(tid, "") for tid in item.tagIds]),
+                        )
+                    )
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def update_items_from_csv_readable(
         self, filepath: PathStr, dry_run: bool = False
     ) -> None:
         """update_items_from_csv_readable method."""
+        for loc_id, loc_path in self.build_location_lookup_tree().items():
+            self._path_cache.setdefault(loc_path, loc_id)
+        # Keyed by item id so a repeated row overrides earlier ones, as the
+        # serial PUTs did.
+        updates: Dict[str, Dict[str, Any]] = {}
+        tag_ids_by_cell: Dict[str, List[str]] = {}
         with open(filepath, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Optional columns missing from the header point at a padding cell,
+            # so every row is read positionally and absent values come back empty.
+            pad = len(header)
+            width = pad + 1
+            columns = {name: i for i, name in enumerate(header)}
+            if header and "name" not in columns:
+                raise ValueError("CSV is missing the 'name' column")
+            id_col = columns.get("id", pad)
+            name_col = columns.get("name", pad)
+            description_col = columns.get("description", pad)
+            quantity_col = columns.get("quantity", pad)
+            path_col = columns.get("locationPath", pad)
+            tags_col = columns.get("tags", pad)
             for row in reader:
-                item_id = row.get("id")
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                item_id = row[id_col]
                 if not item_id:
-                    logging.warning(f"Missing item id in row: {row}")
+                    logging.warning(f"Missing item id in row: {dict(zip(header, row))}")
                     continue
-                location_id = self.resolve_location_path(row.get("locationPath", ""))
-                tag_ids = self.resolve_tag_names(row.get("tags", ""))
+                location_id = self.resolve_location_path(row[path_col])
+                tags_cell = row[tags_col]
+                tag_ids = tag_ids_by_cell.get(tags_cell)
+                if tag_ids is None:
+                    tag_ids = tag_ids_by_cell[tags_cell] = self.resolve_tag_names(
+                        tags_cell
+                    )
                 data = {
-                    "name": row["name"],
-                    "description": row.get("description", ""),
-                    "quantity": int(row.get("quantity", 1)),
+                    "name": row[name_col],
+                    "description": row[description_col],
+                    "quantity": int(row[quantity_col] or 1),
                     "locationId": location_id,
                     "tagIds": tag_ids,
                 }
                 if dry_run:
                     logging.info(f"[DRY RUN] Would update item {item_id}: {data}")
                 else:
-                    res = requests.put(
-                        f"{self.base_url}/items/{item_id}",
-                        headers=self.headers,
-                        json=data,
-                    )
-                    res.raise_for_status()
-                    logging.info(f"Updated item '{row['name']}'")
-
-
+                    updates[item_id] = data
+        if not updates:
+            return
+
+        def put(item_id: str, data: Dict[str, Any]) -> None:
+            """Sends a single item update."""
+            res = self.session.put(f"{self.base_url}/items/{item_id}", json=data)
+            res.raise_for_status()
+            logging.info(f"Updated item '{data['name']}'")
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            futures = [
+                pool.submit(put, item_id, data) for item_id, data in updates.items()
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
 
     def get_all_labels(self) -> List[Label]:
         """get_all_labels method."""
-        res = requests.get(f"{self.base_url}/labels", headers=self.headers)
+        res = self.session.get(f"{self.base_url}/labels")
         res.raise_for_status()
-        return [Label(id=label["id"], name=label["name"], client=self) for label in res.json()]
-
+        return [
+            Label(id=label["id"], name=label["name"], client=self)
+            for label in json_loads(res.content)
+        ]
 
     def get_or_create_label(self, name: str) -> Label:
         """get_or_create_label method."""
         for label in self.get_all_labels():
             if label.name == name:
                 return label
-        res = requests.post(f"{self.base_url}/labels", headers=self.headers, json={"name": name})
+        res = self.session.post(f"{self.base_url}/labels", json={"name": name})
         res.raise_for_status()
-        d = res.json()
+        d = json_loads(res.content)
         return Label(id=d["id"], name=d["name"], client=self)
 
+
 def load_locations_from_csv(filepath: Any) -> Any:
     """load_locations_from_csv method."""
     with open(filepath, newline="", encoding="utf-8") as f:
@@ -552,13 +761,27 @@ def cli() -> Any:
         else:
             client.create_location(args.name, args.description, args.parent)
     elif args.command == "import-locations":
+        client.get_all_locations()
+        locs_by_id = client._locs_by_id
+        existing = {
+            (loc.name, locs_by_id[loc.parentId].name if loc.parentId else None)
+            for loc in locs_by_id.values()
+            if not loc.parentId or loc.parentId in locs_by_id
+        }
         for loc in load_locations_from_csv(args.csv):
+            key = (loc["name"], loc["parent"] or None)
+            if key in existing:
+                logging.info(
+                    f"Location '{key[0]}' (parent: '{key[1]}') already exists. Skipping."
+                )
+                continue
             if args.dry_run:
                 logging.info(
                     f"[DRY RUN] Would create location '{loc['name']}' with parent '{loc['parent']}'"
                 )
             else:
-                client.create_location(loc["name"], loc["description"], loc["parent"])
+                client._post_location(loc["name"], loc["description"], key[1])
+            existing.add(key)
     elif args.command == "export-items":
         client.export_items_readable_csv(args.csv)
     elif args.command == "update-items":